@@ -5,6 +5,7 @@ Base models and utilities for SQLAlchemy integration.
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 import os
 import logging
 
@@ -25,6 +26,8 @@ class SQLAlchemyManager:
     def __init__(self):
         self.engine = None
         self.Session = None
+        # Процесс, в котором был создан пул соединений engine
+        self.pid = None
         # Не инициализируем engine автоматически
     
     def setup_engine(self, database_url=None):
@@ -46,6 +49,10 @@ class SQLAlchemyManager:
                     'echo': False,
                     'connect_args': {"check_same_thread": False}
                 }
+                # База в памяти живет, пока открыто соединение, поэтому все
+                # потоки используют одно общее соединение
+                if ':memory:' in database_url:
+                    engine_options['poolclass'] = StaticPool
             elif database_url.startswith('postgresql'):
                 engine_options = {
                     'echo': False,
@@ -61,13 +68,40 @@ class SQLAlchemyManager:
                     'pool_recycle': 300
                 }
             
+            # Размер пула можно переопределить через переменные окружения
+            # (например, для тестов с параллельными сессиями)
+            pool_size = os.getenv('DB_POOL_SIZE')
+            if pool_size and ':memory:' not in database_url:
+                engine_options.update({
+                    'pool_size': int(pool_size),
+                    'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', '0')),
+                    'pool_pre_ping': True,
+                    'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', '3600'))
+                })
+            
             self.engine = create_engine(database_url, **engine_options)
             self.Session = sessionmaker(bind=self.engine)
+            self.pid = os.getpid()
             logger.info("SQLAlchemy engine setup successful")
         except Exception as e:
             logger.error(f"Error setting up SQLAlchemy engine: {e}")
             raise
     
+    def ensure_process_pool(self):
+        """
+        Сбрасывает пул соединений, унаследованный от родительского процесса.
+        
+        После fork (например, при запуске тестов с --parallel) дочерний процесс
+        не должен использовать соединения родителя, поэтому пул engine
+        пересоздается без закрытия чужих соединений.
+        
+        База данных при этом не меняется. Отдельные файлы SQLite процессам
+        тестов назначает раннер webapp.tests.runner.SQLAlchemyTestRunner.
+        """
+        if self.engine is not None and self.pid != os.getpid():
+            self.engine.dispose(close=False)
+            self.pid = os.getpid()
+    
     def create_tables(self):
         """Создание всех таблиц"""
         try:
@@ -6,8 +6,9 @@
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Boolean, Index
+from sqlalchemy.orm import relationship, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from botapp.models_base import Base, db_manager
 
 
@@ -19,6 +20,10 @@ class Contraction(Base):
     а также связью с отдельными событиями схваток.
     """
     __tablename__ = 'contractions'
+    __table_args__ = (
+        # Индекс для выборки сессий пользователя, отсортированных по времени начала
+        Index('ix_contraction_user_start', 'user_id', 'start_time'),
+    )
     
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
@@ -53,17 +58,11 @@ class Contraction(Base):
         if len(self.contraction_events) < 2:
             return None
         
-        # Сортируем события по времени
-        sorted_events = sorted(self.contraction_events, key=lambda e: e.timestamp)
-        
-        # Рассчитываем интервалы между последовательными схватками
-        intervals = []
-        for i in range(1, len(sorted_events)):
-            delta = sorted_events[i].timestamp - sorted_events[i-1].timestamp
-            intervals.append(delta.total_seconds() / 60)
-        
-        # Возвращаем среднее значение
-        return sum(intervals) / len(intervals)
+        # Сумма интервалов между соседними схватками равна разнице между
+        # последней и первой, поэтому сортировка событий не нужна
+        timestamps = [event.timestamp for event in self.contraction_events]
+        delta = max(timestamps) - min(timestamps)
+        return delta.total_seconds() / 60 / (len(timestamps) - 1)
 
 
 class ContractionEvent(Base):
@@ -188,6 +187,10 @@ class FeedingSession(Base):
     отдельных таймеров для каждой груди.
     """
     __tablename__ = 'feeding_sessions'
+    __table_args__ = (
+        # Индекс для выборки сессий кормления ребенка за период (статистика)
+        Index('ix_feeding_child_ts', 'child_id', 'timestamp'),
+    )
     
     id = Column(Integer, primary_key=True)
     child_id = Column(Integer, ForeignKey('children.id'), nullable=False)
@@ -284,7 +287,10 @@ def get_contraction_sessions(user_id):
     """
     session = db_manager.get_session()
     try:
-        contractions = session.query(Contraction).filter_by(user_id=user_id).order_by(Contraction.start_time.desc()).all()
+        # События загружаются одним дополнительным запросом для всех сессий
+        contractions = session.query(Contraction).options(
+            selectinload(Contraction.contraction_events)
+        ).filter_by(user_id=user_id).order_by(Contraction.start_time.desc()).all()
         return contractions
     finally:
         db_manager.close_session(session)
@@ -311,6 +317,9 @@ def create_contraction_session(user_id, notes=None):
         session.add(contraction)
         session.commit()
         session.refresh(contraction)
+        # У новой сессии еще нет схваток: пустая коллекция помечается как
+        # загруженная, чтобы сериализация после закрытия сессии не обращалась к БД
+        set_committed_value(contraction, 'contraction_events', [])
         return contraction
     except Exception as e:
         session.rollback()
@@ -331,7 +340,9 @@ def end_contraction_session(session_id):
     """
     session = db_manager.get_session()
     try:
-        contraction = session.query(Contraction).filter_by(id=session_id).first()
+        contraction = session.query(Contraction).options(
+            selectinload(Contraction.contraction_events)
+        ).filter_by(id=session_id).first()
         if contraction:
             contraction.end_time = datetime.utcnow()
             session.commit()
@@ -0,0 +1,13 @@
+"""
+Общая конфигурация pytest для проекта.
+"""
+
+import os
+
+# SQLAlchemy в тестах работает с общей SQLite базой в памяти, чтобы не
+# тратить время на запись на диск. Django и так использует базу в памяти
+# для тестов на SQLite. Другую базу можно указать через TEST_DATABASE_URL.
+os.environ['DATABASE_URL'] = os.getenv(
+    'TEST_DATABASE_URL',
+    'sqlite+pysqlite:///file::memory:?cache=shared&uri=true'
+)
@@ -0,0 +1,17 @@
+"""add contraction user start index
+
+Revision ID: add_contraction_user_start_index
+Revises: add_pregnancy_week
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+
+revision = 'add_contraction_user_start_index'
+down_revision = 'add_pregnancy_week'
+
+def upgrade():
+    op.create_index('ix_contraction_user_start', 'contractions', ['user_id', 'start_time'])
+
+def downgrade():
+    op.drop_index('ix_contraction_user_start', table_name='contractions')
@@ -0,0 +1,17 @@
+"""add feeding child timestamp index
+
+Revision ID: add_feeding_child_timestamp_index
+Revises: add_contraction_user_start_index
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+
+revision = 'add_feeding_child_timestamp_index'
+down_revision = 'add_contraction_user_start_index'
+
+def upgrade():
+    op.create_index('ix_feeding_child_ts', 'feeding_sessions', ['child_id', 'timestamp'])
+
+def downgrade():
+    op.drop_index('ix_feeding_child_ts', table_name='feeding_sessions')
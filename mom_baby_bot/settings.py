@@ -161,6 +161,9 @@ STATICFILES_DIRS = [
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Тестовый раннер: при --parallel каждый процесс использует свою базу SQLAlchemy
+TEST_RUNNER = 'webapp.tests.runner.SQLAlchemyTestRunner'
+
 # Конфигурация SQLAlchemy
 # Позволяет использовать SQLAlchemy вместе с Django
 SQLALCHEMY_DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:////data/mom_baby_bot.db')
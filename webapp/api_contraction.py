@@ -11,6 +11,7 @@ from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views import View
 from django.utils.decorators import method_decorator
+from sqlalchemy.orm import joinedload
 
 from botapp.models import User
 from webapp.utils.db_utils import get_db_manager
@@ -136,10 +137,13 @@ class ContractionSessionDetailView(View):
             user_id = int(user_id)
             session_id = int(session_id)
             
-            # Получаем сессию схваток
+            # Получаем сессию схваток вместе с событиями одним запросом
+            db_manager = get_db_manager()
             db_session = db_manager.get_session()
             try:
-                contraction = db_session.query(Contraction).filter_by(id=session_id).first()
+                contraction = db_session.query(Contraction).options(
+                    joinedload(Contraction.contraction_events)
+                ).filter_by(id=session_id).first()
                 
                 # Проверяем существование сессии и принадлежность пользователю
                 if not contraction:
@@ -165,6 +169,7 @@ class ContractionSessionDetailView(View):
             session_id = int(session_id)
             
             # Получаем сессию схваток
+            db_manager = get_db_manager()
             db_session = db_manager.get_session()
             try:
                 contraction = db_session.query(Contraction).filter_by(id=session_id).first()
@@ -210,6 +215,7 @@ class ContractionEventView(View):
             session_id = int(session_id)
             
             # Получаем сессию схваток
+            db_manager = get_db_manager()
             db_session = db_manager.get_session()
             try:
                 contraction = db_session.query(Contraction).filter_by(id=session_id).first()
@@ -0,0 +1,115 @@
+"""
+Утилиты для тестов, проверяющих содержимое отрендеренных страниц.
+"""
+
+from functools import lru_cache
+from html.parser import HTMLParser
+
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+
+
+@lru_cache(maxsize=None)
+def render_page(url_name):
+    """
+    Рендерит страницу прямым вызовом представления, без стека middleware.
+
+    Результат кэшируется на время работы процесса, поэтому все тестовые
+    классы, проверяющие одну и ту же страницу, используют один рендер.
+    Не подходит для тестов, которые меняют настройки шаблонов.
+
+    Args:
+        url_name (str): Имя URL, например 'webapp:feeding_tracker'.
+
+    Returns:
+        HttpResponse: Ответ представления.
+
+    Raises:
+        AssertionError: Если представление вернуло статус, отличный от 200.
+            Статус проверяется здесь один раз, а не в каждом тесте.
+    """
+    url = reverse(url_name)
+    response = resolve(url).func(RequestFactory().get(url))
+    if response.status_code != 200:
+        raise AssertionError(f"Страница {url} вернула статус {response.status_code}")
+    return response
+
+
+class _ElementIdCollector(HTMLParser):
+    """Собирает значения атрибутов id всех элементов страницы."""
+
+    def __init__(self):
+        super().__init__()
+        self.ids = set()
+
+    def handle_starttag(self, tag, attrs):
+        self.ids.update(value for name, value in attrs if name == 'id' and value)
+
+
+def collect_element_ids(content):
+    """
+    Разбирает HTML один раз и возвращает идентификаторы всех элементов.
+
+    Args:
+        content (str): HTML-код страницы.
+
+    Returns:
+        frozenset: Значения атрибутов id.
+    """
+    collector = _ElementIdCollector()
+    collector.feed(content)
+    collector.close()
+    return frozenset(collector.ids)
+
+
+def encode_needles(needles_by_group):
+    """
+    Кодирует фрагменты в UTF-8 один раз, чтобы искать их прямо в байтах ответа.
+
+    Args:
+        needles_by_group (dict): Группы искомых подстрок.
+
+    Returns:
+        dict: Те же группы из пар (подстрока, подстрока в UTF-8).
+    """
+    return {
+        group: tuple((needle, needle.encode('utf-8')) for needle in needles)
+        for group, needles in needles_by_group.items()
+    }
+
+
+class PageContentMixin:
+    """
+    Табличные проверки содержимого страницы, загруженной один раз на класс.
+
+    Тестовый класс должен сохранить ответ в атрибуте response, а для
+    проверки идентификаторов элементов — результат collect_element_ids()
+    в атрибуте element_ids (обычно в setUpClass). Каждый фрагмент и
+    идентификатор проверяется в отдельном подтесте, поэтому отчет
+    перечисляет все отсутствующие элементы.
+    """
+
+    def assertNeedleGroups(self, encoded_needles):
+        """
+        Проверяет каждый фрагмент из таблицы в отдельном подтесте.
+
+        Args:
+            encoded_needles (dict): Результат encode_needles().
+        """
+        for group, needles in encoded_needles.items():
+            for needle, encoded in needles:
+                with self.subTest(group=group, needle=needle):
+                    # assertIn вывел бы в сообщении об ошибке всю страницу
+                    self.assertTrue(encoded in self.response.content, 'Фрагмент не найден на странице')
+
+    def assertIdGroups(self, ids_by_group):
+        """
+        Проверяет каждый идентификатор из таблицы в отдельном подтесте.
+
+        Args:
+            ids_by_group (dict): Группы идентификаторов элементов.
+        """
+        for group, element_ids in ids_by_group.items():
+            for element_id in element_ids:
+                with self.subTest(group=group, element_id=element_id):
+                    self.assertIn(element_id, self.element_ids)
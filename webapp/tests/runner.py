@@ -0,0 +1,91 @@
+"""
+Тестовый раннер Django с отдельной базой SQLAlchemy для каждого процесса.
+
+При запуске `manage.py test --parallel` Django сам создает копии своей
+тестовой базы для каждого процесса, но модели SQLAlchemy работают с базой
+из DATABASE_URL. Чтобы процессы не блокировали друг друга на одном файле
+SQLite, каждый из них получает собственный файл с номером процесса.
+"""
+
+import os
+
+from django.test import runner as django_runner
+from django.test.runner import DiscoverRunner, ParallelTestSuite
+from sqlalchemy.engine import make_url
+
+
+def worker_database_url(database_url, worker_id):
+    """
+    Возвращает URL базы SQLAlchemy для процесса с указанным номером.
+
+    Номер добавляется к имени файла SQLite. База в памяти и так своя у
+    каждого процесса, а другие СУБД не поддерживаются: для них URL
+    возвращается без изменений.
+
+    Args:
+        database_url (str): Исходный URL базы данных.
+        worker_id (int): Номер процесса, начиная с 1.
+
+    Returns:
+        str: URL базы данных процесса.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() != 'sqlite' or not url.database or ':memory:' in url.database:
+        return database_url
+
+    stem, ext = os.path.splitext(url.database)
+    return url.set(database=f'{stem}_{worker_id}{ext}').render_as_string(hide_password=False)
+
+
+def _init_worker(*args, **kwargs):
+    """
+    Инициализирует процесс Django и переключает SQLAlchemy на базу процесса.
+
+    Функция объявлена на уровне модуля из-за требований multiprocessing.
+    """
+    django_runner._init_worker(*args, **kwargs)
+
+    database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        return
+
+    from botapp.models_base import db_manager
+
+    database_url = worker_database_url(database_url, django_runner._worker_id)
+    os.environ['DATABASE_URL'] = database_url
+    # Соединения, унаследованные от родительского процесса, не закрываются
+    db_manager.ensure_process_pool()
+    db_manager.setup_engine(database_url)
+
+
+class SQLAlchemyParallelTestSuite(ParallelTestSuite):
+    """Параллельный набор тестов, процессы которого используют свои базы SQLAlchemy."""
+
+    init_worker = _init_worker
+
+
+class SQLAlchemyTestRunner(DiscoverRunner):
+    """
+    Тестовый раннер проекта.
+
+    Без --parallel работает как DiscoverRunner. С --parallel каждый процесс
+    использует собственный файл SQLite, а после запуска эти файлы удаляются.
+    """
+
+    parallel_test_suite = SQLAlchemyParallelTestSuite
+
+    def teardown_databases(self, old_config, **kwargs):
+        """Удаляет тестовые базы Django и файлы SQLite процессов."""
+        super().teardown_databases(old_config, **kwargs)
+
+        database_url = os.getenv('DATABASE_URL')
+        if not database_url or self.parallel < 2:
+            return
+
+        for worker_id in range(1, self.parallel + 1):
+            worker_url = worker_database_url(database_url, worker_id)
+            if worker_url == database_url:
+                break
+            path = make_url(worker_url).database
+            if os.path.exists(path):
+                os.remove(path)
